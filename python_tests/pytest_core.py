@@ -116,3 +116,11 @@ class OpInfo:
     # All keyword arguments are considered constant.
     # If symbolic_parameter_list is None, then we assume all parameters to be symbolic.
     symbolic_parameter_list: Optional[list[ArgumentType]] = None
+
+    # Positions of the symbolic parameters, computed from symbolic_parameter_list
+    # when the op is first executed.
+    symbolic_indices: Optional[list[int]] = field(default=None, init=False, repr=False)
+
+    # Caches the functions that define each argument in a FusionDefinition,
+    # keyed by the python types of the arguments.
+    arg_binders: dict = field(default_factory=dict, init=False, repr=False)
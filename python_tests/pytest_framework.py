@@ -35,9 +35,13 @@ def _instantiate_opinfo_test_template(
 
 
 class create_op_test:
-    def __init__(self, opinfos, *, scope=None):
+    def __init__(self, opinfos, *, scope=None, single_dtype=False):
         self.opinfos = opinfos
 
+        # If single_dtype is set, each op is only tested with one of its dtypes,
+        # preferring float32. Used by tests whose behavior is dtype-independent.
+        self.single_dtype = single_dtype
+
         # Acquires the caller's global scope
         if scope is None:
             previous_frame = inspect.currentframe().f_back
@@ -50,7 +54,10 @@ class create_op_test:
         #   Since Python doesn't natively support one-to-many function decorators, the produced
         #   functions are directly assigned to the requested scope (the caller's global scope by default)
         for opinfo in self.opinfos:
-            for dtype in sorted(opinfo.dtypes, key=lambda t: repr(t)):
+            dtypes = sorted(opinfo.dtypes, key=lambda t: repr(t))
+            if self.single_dtype:
+                dtypes = [torch.float32 if torch.float32 in dtypes else dtypes[0]]
+            for dtype in dtypes:
                 test = _instantiate_opinfo_test_template(
                     test_template,
                     opinfo=opinfo,
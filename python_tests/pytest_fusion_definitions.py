@@ -4,6 +4,7 @@
 # Owner(s): ["module: nvfuser"]
 
 import torch
+from typing import Callable
 
 from pytest_core import OpInfo
 from pytest_utils import ArgumentType, is_tensor
@@ -15,12 +16,63 @@ from nvfuser.pytorch_utils import (
 )
 
 
+def _define_tensor(fd: FusionDefinition, a):
+    return fd.from_pytorch(a)
+
+
+def _define_vector(fd: FusionDefinition, a):
+    return fd.define_vector(a)
+
+
+def _define_tensor_list(fd: FusionDefinition, a):
+    if all(map(is_tensor, a)):
+        return [fd.from_pytorch(inner_a) for inner_a in a]
+    return fd.define_vector(a)
+
+
+def _define_symbolic_scalar(fd: FusionDefinition, a):
+    # For symbolic scalars, we do not define with constant value.
+    # Otherwise, it becomes a constant and is not a fusion input.
+    return fd.define_scalar(python_scalar_to_nvfuser_dtype(a))
+
+
+def _define_constant_scalar(fd: FusionDefinition, a):
+    assert not isinstance(a, torch.Tensor)
+    return fd.define_scalar(a)
+
+
+def _define_dtype(fd: FusionDefinition, a):
+    return torch_dtype_to_nvfuser_dtype(a)
+
+
+def _define_constant(fd: FusionDefinition, a):
+    return a
+
+
+def _select_arg_binder(arg_type: ArgumentType, a) -> Callable:
+    if arg_type == ArgumentType.Symbolic:
+        if isinstance(a, torch.Tensor):
+            return _define_tensor
+        elif isinstance(a, list):
+            return _define_tensor_list
+        elif isinstance(a, tuple):
+            return _define_vector
+        else:
+            return _define_symbolic_scalar
+    elif arg_type == ArgumentType.ConstantScalar:
+        return _define_constant_scalar
+    elif isinstance(a, torch.dtype):
+        return _define_dtype
+    else:
+        assert not isinstance(a, torch.Tensor)
+        assert arg_type == ArgumentType.Constant
+        return _define_constant
+
+
 def parse_inputs_fusion_definition(fd: FusionDefinition, opinfo: OpInfo, *args):
     if len(args) == 0:
         return []
 
-    nvf_args = []
-
     if opinfo.symbolic_parameter_list is None:
         opinfo.symbolic_parameter_list = [ArgumentType.Symbolic] * len(args)
     num_symbolic_parameters = len(opinfo.symbolic_parameter_list)
@@ -28,28 +80,19 @@ def parse_inputs_fusion_definition(fd: FusionDefinition, opinfo: OpInfo, *args):
         args
     ), f"{num_symbolic_parameters} vs {len(args)}"
 
-    for arg_type, a in zip(opinfo.symbolic_parameter_list, args):
-        if arg_type == ArgumentType.Symbolic:
-            if isinstance(a, torch.Tensor):
-                nvf_args.append(fd.from_pytorch(a))
-            elif isinstance(a, list) and all(map(is_tensor, a)):
-                nvf_args.append([fd.from_pytorch(inner_a) for inner_a in a])
-            elif isinstance(a, list) or isinstance(a, tuple):
-                nvf_args.append(fd.define_vector(a))
-            else:
-                # For symbolic scalars, we do not define with constant value.
-                # Otherwise, it becomes a constant and is not a fusion input.
-                nvf_args.append(fd.define_scalar(python_scalar_to_nvfuser_dtype(a)))
-        elif arg_type == ArgumentType.ConstantScalar:
-            assert not isinstance(a, torch.Tensor)
-            nvf_args.append(fd.define_scalar(a))
-        elif isinstance(a, torch.dtype):
-            nvf_args.append(torch_dtype_to_nvfuser_dtype(a))
-        else:
-            assert not isinstance(a, torch.Tensor)
-            assert arg_type == ArgumentType.Constant
-            nvf_args.append(a)
-    return nvf_args
+    # The way each argument is defined only depends on its ArgumentType and
+    # python type, which rarely change between the samples of an op. Select
+    # the binders once per argument signature and reuse them afterwards.
+    signature = tuple(map(type, args))
+    binders = opinfo.arg_binders.get(signature)
+    if binders is None:
+        binders = [
+            _select_arg_binder(arg_type, a)
+            for arg_type, a in zip(opinfo.symbolic_parameter_list, args)
+        ]
+        opinfo.arg_binders[signature] = binders
+
+    return [binder(fd, a) for binder, a in zip(binders, args)]
 
 
 # This function will purposely not generate a functional FusionDefintion as
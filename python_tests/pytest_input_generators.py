@@ -14,6 +14,8 @@ from numbers import Number
 
 from pytest_core import OpInfo, SampleInput, ErrorSample, Domain
 from pytest_utils import (
+    make_cached_tensor,
+    make_fast_tensor,
     make_number,
     find_nonmatching_dtype,
     is_floating_dtype,
@@ -135,9 +137,7 @@ def broadcast_error_generator(
     # dims = tuple(range(len(sizes), len(sizes) + np.ndim(operand)))
     # return broadcast_in_dim(operand, tuple(sizes) + np.shape(operand), dims)
 
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
 
     fewer_original_axes = (
         ([2, 3], [True, False]),
@@ -165,9 +165,7 @@ def broadcast_error_generator(
 def broadcast_in_dim_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_cached_tensor, dtype=dtype, requires_grad=requires_grad)
 
     # The first 5 test cases below are taken from JAX's broadcast_in_dim tests
     #   https://github.com/google/jax/blob/main/tests/lax_test.py#L1171
@@ -194,9 +192,7 @@ def broadcast_in_dim_error_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
     # jax.lax.broadcast_in_dim(operand, shape, broadcast_dimensions)
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
 
     # 1. Every dimension in the input tensor must be used in broadcast_dimensions.
     missing_axis_in_bcast_dims = (
@@ -271,9 +267,7 @@ def broadcast_in_dim_error_generator(
 def cat_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
 
     # concatenating tensors along singleton, broadcast dimensions is unsupported by nvFuser.
     # https://github.com/NVIDIA/Fuser/issues/224
@@ -294,9 +288,7 @@ def cat_generator(
 
 
 def cat_error_generator(op, dtype=torch.float32, requires_grad: bool = False, **kwargs):
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
     # shapes, dim, exception type, exception string
     empty_input_tensors = (
         ([], 0),
@@ -442,9 +434,7 @@ def define_tensor_error_generator(
         check_shape_unknown_dtypes,
     ]
 
-    input_tensor = make_tensor(
-        (10, 10), device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    input_tensor = make_fast_tensor((10, 10), dtype=dtype, requires_grad=requires_grad)
     for es in error_cases:
         yield SampleInput(input_tensor, **es.kwargs), es.ex_type, es.ex_str
 
@@ -657,8 +647,7 @@ def elementwise_unary_generator(
     low = None if op.domain.low is None else max(-9, op.domain.low)
     high = None if op.domain.high is None else min(9, op.domain.high)
     make_arg = partial(
-        make_tensor,
-        device="cuda",
+        make_cached_tensor,
         dtype=dtype,
         low=low,
         high=high,
@@ -751,12 +740,8 @@ def gather_generator(
     # * input and index tensors have same ndims.
     # * index tensors must be smaller than input tensor along all dims except specified axis.
 
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
-    make_index = partial(
-        make_tensor, device="cuda", dtype=torch.long, requires_grad=False
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
+    make_index = partial(make_fast_tensor, dtype=torch.long, requires_grad=False)
 
     # a.shape, dim, b.shape
     cases = (
@@ -787,10 +772,8 @@ def gather_generator(
 def index_select_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
-    make_index = partial(make_tensor, device="cuda", requires_grad=False)
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
+    make_index = partial(make_fast_tensor, requires_grad=False)
 
     # a.shape, dim, b.shape
     cases = (
@@ -818,10 +801,8 @@ def index_select_error_generator(
     # * dim is within bounds
     # * index is a 1D vector
     # * index array can't have zero elements
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
-    make_index = partial(make_tensor, device="cuda", requires_grad=False)
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
+    make_index = partial(make_fast_tensor, requires_grad=False)
 
     input_shape = (4, 2)
     index_shape = (8,)
@@ -912,9 +893,7 @@ def pad_error_generator(
     # 1) Interior padding is non-negative
     # 2) Length of pad_widths is equal to number of operands
 
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
 
     input_shape = (2, 2)
     valid_pad_width = [1, 1, -1, 2]
@@ -946,9 +925,7 @@ def pad_error_generator(
 def permute_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_cached_tensor, dtype=dtype, requires_grad=requires_grad)
 
     cases = (
         ((4, 3, 7, 8), (0, 1, 2, 3)),
@@ -968,9 +945,7 @@ def permute_error_generator(
 ):
     # torch.permute(input: torch.Tensor, dims: List[int])
 
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
 
     input_shape = (10, 3, 4, 4)
     # dims = dtype, duplicate, in-range
@@ -1023,8 +998,7 @@ def reduction_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
     make_arg = partial(
-        make_tensor,
-        device="cuda",
+        make_cached_tensor,
         dtype=dtype,
         requires_grad=requires_grad,
         # We set low (inclusive) and high (exclusive) here to avoid values
@@ -1052,8 +1026,7 @@ def reduction_error_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
     make_arg = partial(
-        make_tensor,
-        device="cuda",
+        make_fast_tensor,
         dtype=dtype,
         requires_grad=requires_grad,
         # We set low (inclusive) and high (exclusive) here to avoid values
@@ -1089,18 +1062,16 @@ def reduction_error_generator(
     # TODO Fix duplicate_axis, lower_bound, upper_bound
     error_cases = [int_dtype_axis]
 
-    for shape, es in itertools.product(cases, error_cases):
+    for shape in cases:
         input_tensor = make_arg(shape)
-        axis_fn, ex_type, ex_str = es
-        yield SampleInput(input_tensor, axis_fn(len(shape))), ex_type, ex_str
+        for axis_fn, ex_type, ex_str in error_cases:
+            yield SampleInput(input_tensor, axis_fn(len(shape))), ex_type, ex_str
 
 
 def reshape_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_cached_tensor, dtype=dtype, requires_grad=requires_grad)
 
     # TODO Add examples with negative index
     # TODO: Add zero-dim cases
@@ -1133,9 +1104,7 @@ def reshape_error_generator(
 ):
     # torch.reshape(input: Tensor, shape: [int])
 
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
 
     input_shape = (3, 14)
 
@@ -1158,9 +1127,7 @@ def reshape_error_generator(
 def slice_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_cached_tensor, dtype=dtype, requires_grad=requires_grad)
 
     # shape, start_indices, end_indices
     cases = (
@@ -1176,9 +1143,7 @@ def slice_generator(
 def slice_error_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
 
     # shape
     cases = ((10, 10), (5, 5))
@@ -1228,17 +1193,16 @@ def slice_error_generator(
         check_slice_dims_stride,
     ]
 
-    for shape, es in itertools.product(cases, error_cases):
+    for shape in cases:
         input_tensor = make_arg(shape)
-        yield SampleInput(input_tensor, **es.kwargs), es.ex_type, es.ex_str
+        for es in error_cases:
+            yield SampleInput(input_tensor, **es.kwargs), es.ex_type, es.ex_str
 
 
 def squeeze_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_cached_tensor, dtype=dtype, requires_grad=requires_grad)
 
     # shape, squeeze_dims
     cases = (
@@ -1268,9 +1232,7 @@ def squeeze_generator(
 def squeeze_error_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
 
     # shape, start_indices, end_indices
     out_of_range_cases = (
@@ -1304,12 +1266,8 @@ def squeeze_error_generator(
 def take_along_axis_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
-    make_index = partial(
-        make_tensor, device="cuda", dtype=torch.long, requires_grad=False
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
+    make_index = partial(make_fast_tensor, dtype=torch.long, requires_grad=False)
 
     # a.shape, dim, b.shape
     cases = (
@@ -1348,12 +1306,8 @@ def take_along_axis_error_generator(
     # torch.take_along_dim(input: Tensor, indices: LongTensor, dim: int)
     # * If no dim argument, flatten tensors.
 
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
-    make_index = partial(
-        make_tensor, device="cuda", dtype=torch.long, requires_grad=False
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
+    make_index = partial(make_fast_tensor, dtype=torch.long, requires_grad=False)
 
     input_shape = (4, 2)
     a = make_arg(input_shape)
@@ -1426,13 +1380,11 @@ def where_error_generator(
 ):
     # torch.where(condition, input, other)
 
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
 
     input_shape = (2, 3, 4)
     yield SampleInput(
-        make_tensor(input_shape, device="cuda", dtype=torch.float32),
+        make_fast_tensor(input_shape, dtype=torch.float32),
         make_arg(input_shape),
         make_arg(input_shape),
     ), RuntimeError, "Condition should be of DataType Bool"
@@ -1441,9 +1393,7 @@ def where_error_generator(
 def tensor_size_error_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
 
     check_index_beyond_num_dims = (
         {
@@ -1476,9 +1426,7 @@ def tensor_size_error_generator(
 def vector_at_error_generator(
     op: OpInfo, dtype: torch.dtype, requires_grad: bool = False, **kwargs
 ):
-    make_arg = partial(
-        make_tensor, device="cuda", dtype=dtype, requires_grad=requires_grad
-    )
+    make_arg = partial(make_fast_tensor, dtype=dtype, requires_grad=requires_grad)
 
     check_index_beyond_num_dims = (
         {
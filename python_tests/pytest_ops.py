@@ -6,6 +6,8 @@
 import torch
 import pytest
 import numpy as np
+import jax
+import jax.numpy as jnp
 
 from pytest_fusion_definitions import default_fd_fn, parse_inputs_fusion_definition
 from pytest_framework import create_op_test
@@ -13,8 +15,9 @@ from pytest_core import ReferenceType, OpInfo, SampleInput
 from pytest_opinfos import opinfos
 from pytest_utils import ArgumentType, is_tensor
 from typing import Callable
+from numbers import Number
 
-from nvfuser import FusionDefinition
+from nvfuser import FusionDefinition, compute_tensor_descriptor
 
 
 def is_pre_volta():
@@ -30,23 +33,118 @@ def parse_args_fusion_execution(opinfo: OpInfo, *args):
         opinfo.symbolic_parameter_list = [ArgumentType.Symbolic] * len(args)
     assert len(opinfo.symbolic_parameter_list) == len(args)
 
+    if opinfo.symbolic_indices is None:
+        opinfo.symbolic_indices = [
+            idx
+            for idx, arg_type in enumerate(opinfo.symbolic_parameter_list)
+            if arg_type == ArgumentType.Symbolic
+        ]
+
     result = []
-    for arg_type, a in zip(opinfo.symbolic_parameter_list, args):
-        if arg_type == ArgumentType.Symbolic:
-            if isinstance(a, list) and all(map(is_tensor, a)):
-                result.extend(a)
-            else:
-                result.append(a)
+    for idx in opinfo.symbolic_indices:
+        a = args[idx]
+        if isinstance(a, list) and all(map(is_tensor, a)):
+            result.extend(a)
+        else:
+            result.append(a)
     return result
 
 
+def assert_close(actual, expected, *, atol: float, check_dtype: bool = True):
+    """Checks that actual and expected match like torch.testing.assert_close
+    with equal_nan=True and rtol=0.
+
+    For real and integer tensors, the comparison runs entirely on the device
+    and only transfers the final boolean to the host.
+    Other inputs, and tensors that do not match, are checked by
+    torch.testing.assert_close, which also reports the mismatch.
+    """
+    if (
+        isinstance(actual, torch.Tensor)
+        and isinstance(expected, torch.Tensor)
+        and actual.device == expected.device
+        and actual.shape == expected.shape
+        and (not check_dtype or actual.dtype == expected.dtype)
+        and not actual.dtype.is_complex
+        and not expected.dtype.is_complex
+    ):
+        dtype = torch.promote_types(actual.dtype, expected.dtype)
+        if dtype.is_floating_point:
+            # Compute differences in at least single precision so rounding
+            # cannot hide a mismatch in reduced precision dtypes.
+            dtype = torch.promote_types(dtype, torch.float32)
+            a, b = actual.to(dtype), expected.to(dtype)
+            close = (a == b) | ((a - b).abs() <= atol) | (a.isnan() & b.isnan())
+        else:
+            close = actual.to(dtype) == expected.to(dtype)
+        if close.all().item():
+            return
+
+    torch.testing.assert_close(
+        actual, expected, equal_nan=True, atol=atol, rtol=0, check_dtype=check_dtype
+    )
+
+
 # ****** Check an Operation's Results are Correct ******
 
 
-def torch_correctness_test_fn(fd_fn: Callable, nvf_op: OpInfo, sample: SampleInput):
-    with FusionDefinition() as fd:
-        fd_fn(fd, nvf_op, *sample.args, **sample.kwargs)
-    nvfuser_result = fd.execute(parse_args_fusion_execution(nvf_op, *sample.args))
+def _fusion_definition_key(arg_type: ArgumentType, a):
+    if isinstance(a, torch.Tensor):
+        # from_pytorch defines sizes of 1 as broadcast dimensions and all other
+        # sizes as symbolic. Contiguity and stride order are computed from the
+        # sizes and strides like define_tensor does.
+        contiguity, stride_order = compute_tensor_descriptor(a.size(), a.stride())
+        return (
+            a.dtype,
+            tuple(size == 1 for size in a.size()),
+            tuple(contiguity),
+            tuple(stride_order),
+        )
+    if isinstance(a, list) and a and all(map(is_tensor, a)):
+        return tuple(_fusion_definition_key(arg_type, inner_a) for inner_a in a)
+    if arg_type == ArgumentType.Symbolic and isinstance(a, Number):
+        # Symbolic scalars are fusion inputs defined only by their dtype.
+        return type(a)
+    if isinstance(a, (list, tuple)):
+        return (
+            type(a),
+            tuple(_fusion_definition_key(ArgumentType.Constant, x) for x in a),
+        )
+    # Constant values are baked into the definition.
+    return (type(a), a)
+
+
+def get_fusion_definition(
+    fd_cache: dict, fd_fn: Callable, nvf_op: OpInfo, sample: SampleInput
+):
+    """Returns a FusionDefinition for the sample, reusing one from fd_cache
+    when an earlier sample had the same nvFuser-visible structure."""
+    arg_types = nvf_op.symbolic_parameter_list
+    if arg_types is None:
+        arg_types = [ArgumentType.Symbolic] * len(sample.args)
+    key = (
+        tuple(map(_fusion_definition_key, arg_types, sample.args)),
+        tuple(
+            (k, _fusion_definition_key(ArgumentType.Constant, v))
+            for k, v in sorted(sample.kwargs.items())
+        ),
+    )
+    fd = fd_cache.get(key)
+    if fd is None:
+        with FusionDefinition() as fd:
+            fd_fn(fd, nvf_op, *sample.args, **sample.kwargs)
+        fd_cache[key] = fd
+    return fd
+
+
+def execute_fusion(
+    fd_cache: dict, fd_fn: Callable, nvf_op: OpInfo, sample: SampleInput
+):
+    fd = get_fusion_definition(fd_cache, fd_fn, nvf_op, sample)
+    return fd.execute(parse_args_fusion_execution(nvf_op, *sample.args))
+
+
+def torch_correctness_test_fn(nvf_op: OpInfo, sample: SampleInput, nvfuser_result):
     torch_result = nvf_op.reference(*sample.args, **sample.kwargs)
 
     if isinstance(nvfuser_result, Exception):
@@ -57,45 +155,42 @@ def torch_correctness_test_fn(fd_fn: Callable, nvf_op: OpInfo, sample: SampleInp
 
     # TODO If dtype is fp16 or bf16, skip dtype check because nvfuser promotes to fp32 but does not return original dtype.
     # TODO Add specific dtype tolerances
-    torch.testing.assert_close(
-        nvfuser_result, torch_result, equal_nan=True, atol=1e-3, rtol=0
-    )
+    assert_close(nvfuser_result, torch_result, atol=1e-3)
 
 
-def jax_correctness_test_fn(fd_fn: Callable, nvf_op: OpInfo, sample: SampleInput):
-    with FusionDefinition() as fd:
-        fd_fn(fd, nvf_op, *sample.args, **sample.kwargs)
-    nvfuser_result = fd.execute(parse_args_fusion_execution(nvf_op, *sample.args))
-
+def jax_correctness_test_fn(nvf_op: OpInfo, sample: SampleInput, nvfuser_result):
     jax_sample = sample.jax()
     jax_result = nvf_op.reference(*jax_sample.args, **jax_sample.kwargs)
 
-    # NOTE: this strange unpacking is to handle NumPy's and JAX's sometimes odd
-    #   number vs. array representation. In particular, NumPy can mimic
-    #   Python numbers, but `asarray` doesn't understand this mimicry
-    np_array = np.array(jax_result)
-    if np_array.shape == ():
-        jax_result = torch.tensor(np_array.item(), device="cuda")
+    if (
+        isinstance(jax_result, jax.Array)
+        and jax_result.ndim > 0
+        and jax_result.dtype != jnp.bool_
+    ):
+        # Import the jax array through DLPack, which shares its device memory
+        # instead of copying it through a host NumPy array.
+        jax_result = torch.from_dlpack(jax_result).to("cuda")
     else:
-        jax_result = torch.asarray(np_array, device="cuda")
+        # NOTE: this strange unpacking is to handle NumPy's and JAX's sometimes odd
+        #   number vs. array representation. In particular, NumPy can mimic
+        #   Python numbers, but `asarray` doesn't understand this mimicry
+        np_array = np.array(jax_result)
+        if np_array.shape == ():
+            jax_result = torch.full((), np_array.item(), device="cuda")
+        else:
+            jax_result = torch.asarray(np_array, device="cuda")
 
     if len(nvfuser_result) == 1:
         nvfuser_result = nvfuser_result[0]
 
     # NOTE: dtype is not checked because jax will translate int64, float64, and complex128 to int32, float32 and complex64
-    torch.testing.assert_close(
-        nvfuser_result, jax_result, equal_nan=True, atol=1e-3, rtol=0, check_dtype=False
-    )
+    assert_close(nvfuser_result, jax_result, atol=1e-3, check_dtype=False)
 
 
-def python_correctness_test_fn(fd_fn: Callable, nvf_op: OpInfo, sample: SampleInput):
+def python_correctness_test_fn(nvf_op: OpInfo, sample: SampleInput, nvfuser_result):
     # python reference function does not accept keyword arguments
     assert len(sample.kwargs) == 0
 
-    with FusionDefinition() as fd:
-        fd_fn(fd, nvf_op, *sample.args)
-    nvfuser_result = fd.execute(parse_args_fusion_execution(nvf_op, *sample.args))
-
     # expect only single result from function
     assert len(nvfuser_result) == 1
 
@@ -108,8 +203,8 @@ def python_correctness_test_fn(fd_fn: Callable, nvf_op: OpInfo, sample: SampleIn
     # create pytorch tensor
     np_array = np.array(list(python_result))
     if np_array.shape == ():
-        python_result = torch.tensor(
-            np_array.item(), dtype=nvfuser_result[0].dtype, device="cuda"
+        python_result = torch.full(
+            (), np_array.item(), dtype=nvfuser_result[0].dtype, device="cuda"
         )
     else:
         python_result = torch.asarray(
@@ -117,12 +212,10 @@ def python_correctness_test_fn(fd_fn: Callable, nvf_op: OpInfo, sample: SampleIn
         )
 
     # reshape flat output tensor into expected shape
-    torch.testing.assert_close(
+    assert_close(
         nvfuser_result[0],
         python_result.reshape(nvfuser_result[0].shape),
-        equal_nan=True,
         atol=1e-3,
-        rtol=0,
     )
 
 
@@ -130,26 +223,36 @@ def correctness_test_fn(
     reference_type: ReferenceType,
     nvf_op: OpInfo,
     sample: SampleInput,
+    nvfuser_result,
 ):
-    _fd_fn = (
-        nvf_op.fd_correctness_fn
-        if nvf_op.fd_correctness_fn is not None
-        else default_fd_fn
-    )
     if reference_type == ReferenceType.Pytorch:
-        return torch_correctness_test_fn(_fd_fn, nvf_op, sample)
+        return torch_correctness_test_fn(nvf_op, sample, nvfuser_result)
     elif reference_type == ReferenceType.Jax:
-        return jax_correctness_test_fn(_fd_fn, nvf_op, sample)
+        return jax_correctness_test_fn(nvf_op, sample, nvfuser_result)
     elif reference_type == ReferenceType.Python:
-        return python_correctness_test_fn(_fd_fn, nvf_op, sample)
+        return python_correctness_test_fn(nvf_op, sample, nvfuser_result)
     else:
         return None
 
 
 @create_op_test(tuple(op for op in opinfos if op.reference is not None))
 def test_correctness(op: OpInfo, dtype: torch.dtype):
-    for sample in op.sample_input_generator(op, dtype):
-        result = correctness_test_fn(op.reference_type, op, sample)
+    _fd_fn = op.fd_correctness_fn if op.fd_correctness_fn is not None else default_fd_fn
+    samples = list(op.sample_input_generator(op, dtype))
+
+    # FusionDefinitions are shared between the samples of this test only, so
+    # they are released once the test finishes.
+    fd_cache = {}
+
+    # Launch the fusions of all samples back to back before checking any of
+    # the results, so the host-side work of the checks does not stall the
+    # device between executions.
+    nvfuser_results = [
+        execute_fusion(fd_cache, _fd_fn, op, sample) for sample in samples
+    ]
+
+    for sample, nvfuser_result in zip(samples, nvfuser_results):
+        result = correctness_test_fn(op.reference_type, op, sample, nvfuser_result)
         if result is not None:
             return result
 
@@ -178,14 +281,18 @@ def definition_op_in_schedule_error_test_fn(opinfo: OpInfo, sample: SampleInput)
     nvfuser_result = fd.execute(parse_args_fusion_execution(opinfo, *sample.args))
 
 
-# TODO Maybe only test a single dtype
-@create_op_test(tuple(op for op in opinfos if op.sample_input_generator is not None))
+@create_op_test(
+    tuple(op for op in opinfos if op.sample_input_generator is not None),
+    single_dtype=True,
+)
 def test_definition_op_in_schedule_error(op: OpInfo, dtype: torch.dtype):
-    for sample in op.sample_input_generator(op, dtype):
-        with pytest.raises(
-            RuntimeError, match=r"Attempting to add to a completed definition"
-        ):
-            definition_op_in_schedule_error_test_fn(op, sample)
+    # The error is raised while building the schedule, so it does not depend
+    # on the sample's values or shape. Only check the first sample.
+    sample = next(op.sample_input_generator(op, dtype))
+    with pytest.raises(
+        RuntimeError, match=r"Attempting to add to a completed definition"
+    ):
+        definition_op_in_schedule_error_test_fn(op, sample)
 
 
 # ****** Check that an Operation's API Gives Appropriate Input Errors ******
@@ -3,8 +3,10 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Owner(s): ["module: nvfuser"]
 
+import math
 import torch
 import jax.numpy as jnp
+from functools import lru_cache
 from torch.testing import make_tensor
 from typing import Optional
 
@@ -129,6 +131,141 @@ def make_number(
     return make_tensor([1], device="cpu", dtype=dtype, low=low, high=high).item()
 
 
+@lru_cache(None)
+def _cuda_generator():
+    # A single seeded generator shared by all fast fills, so the generated
+    # tensors are reproducible between runs.
+    generator = torch.Generator(device="cuda")
+    generator.manual_seed(0)
+    return generator
+
+
+def _fill_random_(
+    result: torch.Tensor,
+    low: Optional[float] = None,
+    high: Optional[float] = None,
+    exclude_zero: bool = False,
+):
+    # Fills result in place from the shared cuda generator, using the same
+    # default ranges and zero replacement as make_tensor.
+    generator = _cuda_generator()
+    dtype = result.dtype
+    if dtype is torch.bool:
+        result.random_(0, 2, generator=generator)
+    elif dtype.is_floating_point or dtype.is_complex:
+        low = -9 if low is None else low
+        high = 9 if high is None else high
+        values = torch.view_as_real(result) if dtype.is_complex else result
+        values.uniform_(low, high, generator=generator)
+    else:
+        low = -9 if low is None else math.ceil(low)
+        high = 10 if high is None else math.ceil(high)
+        result.random_(low, high, generator=generator)
+
+    if exclude_zero:
+        if dtype.is_floating_point:
+            replace_with = torch.finfo(dtype).tiny
+        elif dtype.is_complex:
+            tiny = torch.finfo(dtype).tiny
+            replace_with = complex(tiny, tiny)
+        else:
+            replace_with = 1
+        result.masked_fill_(result == 0, replace_with)
+    return result
+
+
+def make_fast_tensor(
+    shape,
+    *,
+    dtype: torch.dtype,
+    low: Optional[float] = None,
+    high: Optional[float] = None,
+    requires_grad: bool = False,
+):
+    """Returns a random cuda tensor with values in the range [low, high).
+
+    The tensor is filled in place from a shared, seeded cuda generator, which
+    skips make_tensor's argument processing. Use it where the value range is
+    the only constraint on the tensor. The default ranges match make_tensor.
+
+    Args:
+        shape (Sequence[int]): The shape of the tensor.
+        dtype (torch.dtype): Desired dtype for tensor.
+        low (Optional[Number]): Sets the lower limit (inclusive) of the given range.
+        high (Optional[Number]): Sets the upper limit (exclusive) of the given range.
+        requires_grad (bool): If autograd should record operations on the tensor.
+
+    Returns:
+        torch.Tensor: The random tensor with specified properties.
+    """
+    result = torch.empty(shape, device="cuda", dtype=dtype)
+    return _fill_random_(result, low, high).requires_grad_(requires_grad)
+
+
+@lru_cache(maxsize=512)
+def _make_tensor_cached(
+    shape: tuple,
+    dtype: torch.dtype,
+    low: Optional[float],
+    high: Optional[float],
+    requires_grad: bool,
+    noncontiguous: bool,
+    exclude_zero: bool,
+):
+    if noncontiguous and math.prod(shape) > 1:
+        # Mirrors the layout of make_tensor's noncontiguous tensors, which skip
+        # every other element along the innermost dimension.
+        strides = [2]
+        for size in reversed(shape[1:]):
+            strides.insert(0, strides[0] * size)
+        result = torch.empty_strided(shape, strides, device="cuda", dtype=dtype)
+    else:
+        result = torch.empty(shape, device="cuda", dtype=dtype)
+    _fill_random_(result, low, high, exclude_zero)
+
+    return result.requires_grad_(requires_grad)
+
+
+def make_cached_tensor(
+    shape,
+    *,
+    dtype: torch.dtype,
+    low: Optional[float] = None,
+    high: Optional[float] = None,
+    requires_grad: bool = False,
+    noncontiguous: bool = False,
+    exclude_zero: bool = False,
+):
+    """Returns a random cuda tensor that is shared by all callers requesting
+    the same properties.
+
+    The input generators create the same tensors for every op and dtype, so
+    reusing them avoids redundant allocations and random fills. The returned
+    tensor must be treated as read-only.
+
+    Args:
+        shape (Sequence[int]): The shape of the tensor.
+        dtype (torch.dtype): Desired dtype for tensor.
+        low (Optional[Number]): Sets the lower limit (inclusive) of the given range.
+        high (Optional[Number]): Sets the upper limit (exclusive) of the given range.
+        requires_grad (bool): If autograd should record operations on the tensor.
+        noncontiguous (bool): If True, the tensor will be noncontiguous.
+        exclude_zero (bool): If True, zeros are replaced with a small positive value.
+
+    Returns:
+        torch.Tensor: The cached tensor with specified properties.
+    """
+    return _make_tensor_cached(
+        tuple(shape),
+        dtype,
+        low,
+        high,
+        requires_grad,
+        noncontiguous,
+        exclude_zero,
+    )
+
+
 def find_nonmatching_dtype(dtype: torch.dtype):
     if dtype in int_float_dtypes:
         return torch.complex128